@@ -1,36 +1,54 @@
 import streamlit as st
 import pandas as pd
+from contextlib import contextmanager
 from datetime import date
-import plotly.express as px
+import plotly.graph_objects as go
 import os
+import re
 import sqlite3
+import threading
 
 # ---------------- CONFIG ----------------
 st.set_page_config(page_title="Smart Expense Tracker", layout="wide")
 
 DB_FILE = "tracker.db"
+PAGE_SIZE = 100
+# Cached reads are keyed on the data version, so entries from older versions
+# are dead weight; a small cap lets them age out instead of piling up.
+CACHE_MAX_ENTRIES = 32
+MONTH_PATTERN = re.compile(r"[0-9]{4}-(0[1-9]|1[0-2])")
 
 # --------- SESSION STATE FOR EXIT ---------
 if "exited" not in st.session_state:
     st.session_state.exited = False
 
 # ---------------- HEALTH / FEEDBACK HELPERS ----------------
-HEALTHY_CATEGORIES = {
-    "Groceries",
-    "Healthcare",
-    "Medicine",
-    "Gym",
-    "Fitness",
-    "Sports",
-}
+HEALTHY_CATEGORIES = frozenset(
+    {
+        "Groceries",
+        "Healthcare",
+        "Medicine",
+        "Gym",
+        "Fitness",
+        "Sports",
+    }
+)
 
-UNHEALTHY_CATEGORIES = {
-    "Fast Food",
-    "Junk Food",
-    "Alcohol",
-    "Smoking",
-    "Sweets",
-}
+UNHEALTHY_CATEGORIES = frozenset(
+    {
+        "Fast Food",
+        "Junk Food",
+        "Alcohol",
+        "Smoking",
+        "Sweets",
+    }
+)
+
+CATEGORY_TAG = (
+    {c: "healthy" for c in HEALTHY_CATEGORIES}
+    | {c: "unhealthy" for c in UNHEALTHY_CATEGORIES}
+    | {"Food": "neutral"}
+)
 
 # Expanded category list to include health-related options
 CATEGORY_DISPLAY = [
@@ -49,8 +67,14 @@ CATEGORY_DISPLAY = [
 ]
 
 # ---------------- DATABASE HELPERS ----------------
-def get_conn():
-    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+EXPENSE_DTYPES = {
+    "ID": "int32",
+    "Amount": "float64",
+    "Description": "string",
+}
+
+
+def _init_schema(conn):
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS expenses (
@@ -70,130 +94,272 @@ def get_conn():
         )
         """
     )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_expenses_month ON expenses(substr(date, 1, 7))"
+    )
+    conn.commit()
+
+
+@st.cache_resource
+def get_conn():
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL").fetchone()
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    _init_schema(conn)
     return conn
 
 
-def load_expenses() -> pd.DataFrame:
+def _read_expenses(sql: str, params=()) -> pd.DataFrame:
+    df = pd.read_sql_query(sql, get_conn(), params=params, dtype=EXPENSE_DTYPES)
+    df["Category"] = df["Category"].astype("category")
+    return df
+
+
+@st.cache_resource
+def _data_version_holder() -> dict:
+    return {"version": 0}
+
+
+def data_version() -> int:
+    # Cached reads are shared across sessions, so they are keyed on one
+    # process-wide counter that every write bumps.
+    return _data_version_holder()["version"]
+
+
+def _bump_data_version():
+    _data_version_holder()["version"] += 1
+
+
+@st.cache_resource
+def get_write_lock():
+    return threading.Lock()
+
+
+@contextmanager
+def _write_transaction():
+    # The connection is shared by every session thread, so writes are serialized
+    # process-wide. Readers on that connection can see a write before it commits,
+    # so the version is bumped even on rollback to drop anything they cached.
     conn = get_conn()
-    df = pd.read_sql_query(
+    with get_write_lock():
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                yield conn
+        finally:
+            _bump_data_version()
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def fetch_recent(n: int, version: int) -> pd.DataFrame:
+    df = _read_expenses(
         """
         SELECT
             id AS ID,
             date AS Date,
             category AS Category,
-            amount AS Amount,
+            COALESCE(amount, 0) AS Amount,
             description AS Description
         FROM expenses
-        ORDER BY date ASC, id ASC
+        ORDER BY date DESC, id DESC
+        LIMIT ?
         """,
-        conn,
+        params=(n,),
     )
-    conn.close()
-    return df
+    # Oldest first, matching the order of the full history.
+    return df.iloc[::-1].reset_index(drop=True)
+
+
+def save_expenses_many(rows: list[tuple]):
+    # rows are (date, category, amount, description); one transaction, one fsync.
+    with _write_transaction() as conn:
+        conn.executemany(
+            "INSERT INTO expenses(date, category, amount, description) VALUES (?, ?, ?, ?)",
+            [
+                (str(date_value), category, float(amount), description)
+                for date_value, category, amount, description in rows
+            ],
+        )
 
 
 def save_expense(date_value, category, amount, description):
+    save_expenses_many([(date_value, category, amount, description)])
+
+
+def delete_expense_by_id(row_id: int):
+    with _write_transaction() as conn:
+        conn.execute("DELETE FROM expenses WHERE id = ?", (row_id,))
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def fetch_budget(month: str, version: int) -> float:
     conn = get_conn()
-    conn.execute(
-        "INSERT INTO expenses(date, category, amount, description) VALUES (?, ?, ?, ?)",
-        (str(date_value), category, float(amount), description),
+    row = conn.execute("SELECT budget FROM budget WHERE month = ?", (month,)).fetchone()
+    return float(row[0]) if row and row[0] is not None else 0.0
+
+
+def save_budget_row(month: str, budget_amount: float):
+    # Months are stored as canonical YYYY-MM so reads can match them directly.
+    if not MONTH_PATTERN.fullmatch(month):
+        raise ValueError(f"Budget month must be YYYY-MM, got {month!r}")
+    with _write_transaction() as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO budget(month, budget)
+            VALUES (?, ?)
+            """,
+            (month, float(budget_amount)),
+        )
+
+
+def clear_all_data():
+    with _write_transaction() as conn:
+        conn.execute("DELETE FROM expenses")
+        conn.execute("DELETE FROM budget")
+
+
+# ---------------- PAGED QUERIES ----------------
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def count_expense_rows(version: int) -> int:
+    conn = get_conn()
+    return conn.execute(
+        "SELECT COUNT(*) FROM expenses WHERE category != 'Income'"
+    ).fetchone()[0]
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def load_expense_page(page: int, version: int) -> pd.DataFrame:
+    return _read_expenses(
+        """
+        SELECT
+            id AS ID,
+            date AS Date,
+            category AS Category,
+            COALESCE(amount, 0) AS Amount,
+            description AS Description
+        FROM expenses
+        WHERE category != 'Income'
+        ORDER BY date DESC, id DESC
+        LIMIT ? OFFSET ?
+        """,
+        params=(PAGE_SIZE, (page - 1) * PAGE_SIZE),
     )
-    conn.commit()
-    conn.close()
 
 
-def delete_expense_by_id(row_id: int):
+# ---------------- AGGREGATE QUERIES ----------------
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def fetch_month_list(version: int) -> list:
     conn = get_conn()
-    conn.execute("DELETE FROM expenses WHERE id = ?", (row_id,))
-    conn.commit()
-    conn.close()
+    rows = conn.execute(
+        """
+        SELECT DISTINCT substr(date, 1, 7) AS month
+        FROM expenses
+        ORDER BY month DESC
+        """
+    ).fetchall()
+    return [row[0] for row in rows]
 
 
-def load_budget() -> pd.DataFrame:
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def fetch_month_totals(month: str, version: int) -> pd.DataFrame:
     conn = get_conn()
     df = pd.read_sql_query(
         """
         SELECT
-            month AS Month,
-            budget AS Budget
-        FROM budget
-        ORDER BY month ASC
+            category AS Category,
+            SUM(amount) AS Amount
+        FROM expenses
+        WHERE substr(date, 1, 7) = ?
+        GROUP BY category
         """,
         conn,
+        params=(month,),
     )
-    conn.close()
     return df
 
 
-def save_budget_row(month: str, budget_amount: float):
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def fetch_totals(version: int) -> tuple:
     conn = get_conn()
-    conn.execute(
+    income, expense = conn.execute(
         """
-        INSERT OR REPLACE INTO budget(month, budget)
-        VALUES (?, ?)
-        """,
-        (month, float(budget_amount)),
-    )
-    conn.commit()
-    conn.close()
+        SELECT
+            COALESCE(SUM(CASE WHEN category = 'Income' THEN amount ELSE 0 END), 0),
+            COALESCE(SUM(CASE WHEN category != 'Income' THEN amount ELSE 0 END), 0)
+        FROM expenses
+        """
+    ).fetchone()
+    return float(income), float(expense)
 
 
-def clear_all_data():
+def split_income_expense(totals_df: pd.DataFrame) -> tuple:
+    # totals_df holds one summed row per category, as from fetch_month_totals.
+    sums = totals_df.groupby(totals_df["Category"].eq("Income"))["Amount"].sum()
+    return float(sums.get(True, 0.0)), float(sums.get(False, 0.0))
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def fetch_category_breakdown(version: int) -> pd.DataFrame:
     conn = get_conn()
-    conn.execute("DELETE FROM expenses")
-    conn.execute("DELETE FROM budget")
-    conn.commit()
-    conn.close()
+    df = pd.read_sql_query(
+        """
+        SELECT
+            category AS Category,
+            SUM(amount) AS Amount
+        FROM expenses
+        WHERE category != 'Income'
+        GROUP BY category
+        """,
+        conn,
+    )
+    return df
 
 
 # ---------------- HEALTH / FEEDBACK LOGIC ----------------
-def get_health_tag(cat: str) -> str:
-    if cat in HEALTHY_CATEGORIES:
-        return "healthy"
-    if cat in UNHEALTHY_CATEGORIES:
-        return "unhealthy"
-    if cat == "Food":
-        return "neutral"
-    return "neutral"
-
-
-def generate_health_feedback(month_df: pd.DataFrame) -> str:
-    exp_df = month_df[month_df["Category"] != "Income"].copy()
-    if exp_df.empty:
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def generate_health_feedback(month: str, version: int) -> str:
+    month_df = fetch_month_totals(month, version)
+    is_expense = month_df["Category"] != "Income"
+    if not is_expense.any():
         return "No expenses recorded this month, so no lifestyle feedback yet."
 
-    exp_df["HealthTag"] = exp_df["Category"].apply(get_health_tag)
+    tags = month_df.loc[is_expense, "Category"].map(CATEGORY_TAG).fillna("neutral")
 
-    total_spent = exp_df["Amount"].sum()
-    healthy_spent = exp_df[exp_df["HealthTag"] == "healthy"]["Amount"].sum()
-    unhealthy_spent = exp_df[exp_df["HealthTag"] == "unhealthy"]["Amount"].sum()
+    tag_sums = month_df.loc[is_expense, "Amount"].groupby(tags).sum()
+    total_spent = tag_sums.sum()
 
-    healthy_pct = (healthy_spent / total_spent) * 100 if total_spent > 0 else 0
-    unhealthy_pct = (unhealthy_spent / total_spent) * 100 if total_spent > 0 else 0
+    if total_spent > 0:
+        unhealthy_pct = tag_sums.get("unhealthy", 0.0) / total_spent * 100
+        if unhealthy_pct >= 50:
+            return (
+                f"You spent about {unhealthy_pct:.0f}% of your expenses on unhealthy items. "
+                "Consider reducing fast food, alcohol, or junk purchases and think about "
+                "taking or reviewing a health insurance plan."
+            )
 
-    if unhealthy_pct >= 50:
-        return (
-            f"You spent about {unhealthy_pct:.0f}% of your expenses on unhealthy items. "
-            "Consider reducing fast food, alcohol, or junk purchases and think about "
-            "taking or reviewing a health insurance plan."
-        )
-    elif healthy_pct >= 50:
-        return (
-            f"Great job! Around {healthy_pct:.0f}% of your expenses are on healthy areas "
-            "like groceries, healthcare, or fitness. Your spending pattern looks "
-            "supportive of a healthy lifestyle."
-        )
-    else:
-        return (
-            "Your spending is mixed between healthy and other categories. Try to shift "
-            "more expenses towards healthcare, groceries, and fitness, and reduce "
-            "unhealthy categories over time."
-        )
+        healthy_pct = tag_sums.get("healthy", 0.0) / total_spent * 100
+        if healthy_pct >= 50:
+            return (
+                f"Great job! Around {healthy_pct:.0f}% of your expenses are on healthy areas "
+                "like groceries, healthcare, or fitness. Your spending pattern looks "
+                "supportive of a healthy lifestyle."
+            )
+
+    return (
+        "Your spending is mixed between healthy and other categories. Try to shift "
+        "more expenses towards healthcare, groceries, and fitness, and reduce "
+        "unhealthy categories over time."
+    )
 
 
-def generate_income_feedback(month_df: pd.DataFrame) -> str:
-    income = month_df[month_df["Category"] == "Income"]["Amount"].sum()
-    expense = month_df[month_df["Category"] != "Income"]["Amount"].sum()
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def generate_income_feedback(month: str, version: int) -> str:
+    income, expense = split_income_expense(fetch_month_totals(month, version))
 
     if income == 0 and expense == 0:
         return "No income or expenses recorded for this month."
@@ -238,12 +404,84 @@ def show_exit_screen():
     st.stop()
 
 
+# ---------------- CHARTS ----------------
+def category_pie(agg: pd.DataFrame) -> go.Figure:
+    # agg holds one row per category, already summed.
+    return go.Figure(
+        go.Pie(
+            labels=agg["Category"].tolist(),
+            values=agg["Amount"].tolist(),
+            hole=0.4,
+        )
+    )
+
+
+# ---------------- PAGE FRAGMENTS ----------------
+# Month pickers rerun only their own fragment, not the whole script.
+@st.fragment
+def render_statistics(months: list):
+    selected_month = st.selectbox("Select Month", months)
+    totals_df = fetch_month_totals(selected_month, data_version())
+
+    if totals_df.empty:
+        st.info("No records for this month.")
+    else:
+        income, expense = split_income_expense(totals_df)
+
+        st.metric("💵 Income", f"₹ {income:,.0f}")
+        st.metric("💸 Expense", f"₹ {expense:,.0f}")
+
+        exp_only = totals_df[totals_df["Category"] != "Income"]
+        if not exp_only.empty:
+            fig = category_pie(exp_only)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No expenses in this month.")
+
+
+@st.fragment
+def render_insights(months: list):
+    selected_month = st.selectbox("Select Month for Feedback", months)
+    totals_df = fetch_month_totals(selected_month, data_version())
+
+    if totals_df.empty:
+        st.info("No records for this month.")
+    else:
+        income, expense = split_income_expense(totals_df)
+        balance = income - expense
+
+        c1, c2, c3 = st.columns(3)
+        c1.metric("💵 Income", f"₹ {income:,.0f}")
+        c2.metric("💸 Expense", f"₹ {expense:,.0f}")
+        c3.metric("💰 Balance", f"₹ {balance:,.0f}")
+
+        st.markdown("---")
+
+        st.markdown("### 🧬 Lifestyle & Health Feedback")
+        health_fb = generate_health_feedback(selected_month, data_version())
+        st.info(health_fb)
+
+        st.markdown("### 🪙 Income & Savings Feedback")
+        income_fb = generate_income_feedback(selected_month, data_version())
+        st.success(income_fb)
+
+        agg = totals_df[totals_df["Category"] != "Income"]
+        if not agg.empty:
+            st.markdown("### 📊 Where your money went")
+            fig = category_pie(agg)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No expenses in this month, so no spending breakdown to show.")
+
+
 if st.session_state.exited:
     show_exit_screen()
 
 # ---------------- UI ----------------
 st.title("💰 Smart Expense Tracker")
 
+TODAY_MONTH = date.today().strftime("%Y-%m")
+
 menu = st.sidebar.radio(
     "App Menu",
     [
@@ -272,25 +510,16 @@ if menu == "🚪 Exit App":
 if menu == "🏠 Dashboard":
     st.subheader("📊 Overview")
 
-    df = load_expenses()
-    budget_df = load_budget()
+    recent_df = fetch_recent(10, data_version())
 
-    if df.empty:
+    if recent_df.empty:
         st.info("No data available. Start by adding income and expenses.")
         st.stop()
 
-    df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce").fillna(0)
-
-    income = df[df["Category"] == "Income"]["Amount"].sum()
-    expense = df[df["Category"] != "Income"]["Amount"].sum()
+    income, expense = fetch_totals(data_version())
     balance = income - expense
 
-    # Normalize month format to YYYY-MM
-    today_month = str(pd.Timestamp.today().to_period("M"))
-    if not budget_df.empty:
-        budget_df["Month"] = budget_df["Month"].astype(str)
-    budget_row = budget_df[budget_df["Month"] == today_month]
-    budget = float(budget_row.iloc[0]["Budget"]) if not budget_row.empty else 0.0
+    budget = fetch_budget(TODAY_MONTH, data_version())
 
     c1, c2, c3, c4 = st.columns(4)
     c1.metric("💰 Balance", f"₹ {balance:,.0f}")
@@ -324,14 +553,14 @@ if menu == "🏠 Dashboard":
 
     with col1:
         st.subheader("🧾 Recent Transactions")
-        st.dataframe(df.tail(10), use_container_width=True)
+        st.dataframe(recent_df, use_container_width=True)
 
     with col2:
         st.subheader("📊 Spending by Category")
-        exp_df = df[df["Category"] != "Income"]
+        agg = fetch_category_breakdown(data_version())
 
-        if not exp_df.empty:
-            fig = px.pie(exp_df, names="Category", values="Amount", hole=0.4)
+        if not agg.empty:
+            fig = category_pie(agg)
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No expense data yet.")
@@ -340,14 +569,13 @@ if menu == "🏠 Dashboard":
 elif menu == "🎯 Set Budget":
     st.subheader("🎯 Set Monthly Budget")
 
-    default_month = str(pd.Timestamp.today().to_period("M"))
-    month_input = st.text_input("Enter Month (YYYY-MM)", value=default_month)
+    month_input = st.text_input("Enter Month (YYYY-MM)", value=TODAY_MONTH)
     budget_amount = st.number_input("Monthly Budget Amount", min_value=0.0)
 
     if st.button("Save Budget"):
+        # Canonicalize loose input like 2026-2 or Feb 2026 to YYYY-MM once here.
         try:
-            period = pd.Period(month_input, freq="M")
-            month = str(period)
+            month = str(pd.Period(month_input, freq="M"))
         except Exception:
             st.error("Please enter month in valid format like 2026-02.")
         else:
@@ -389,34 +617,42 @@ elif menu == "💸 Add Expense":
 elif menu == "📜 Expense History":
     st.subheader("📜 Expense History (Expenses Only)")
 
-    df = load_expenses()
-    expense_df = df[df["Category"] != "Income"]
+    total_rows = count_expense_rows(data_version())
 
-    if expense_df.empty:
+    if total_rows == 0:
         st.info("No expense records found.")
     else:
-        st.dataframe(
-            expense_df.sort_values("Date", ascending=False),
-            use_container_width=True,
-        )
+        page_count = (total_rows - 1) // PAGE_SIZE + 1
+        page = st.number_input("Page", min_value=1, max_value=page_count, step=1)
+        st.caption(f"Page {page} of {page_count} ({total_rows} expenses)")
+
+        expense_df = load_expense_page(int(page), data_version())
+        st.dataframe(expense_df, use_container_width=True)
 
 # ---------------- DELETE EXPENSE ----------------
 elif menu == "✂️ Delete Expense":
     st.subheader("✂️ Delete an Expense")
 
-    df = load_expenses()
-    expense_df = df[df["Category"] != "Income"].copy()
+    total_rows = count_expense_rows(data_version())
 
-    if expense_df.empty:
+    if total_rows == 0:
         st.info("No expense records available to delete.")
     else:
-        # Use DB ID as RowID
-        expense_df = expense_df.rename(columns={"ID": "RowID"})
+        page_count = (total_rows - 1) // PAGE_SIZE + 1
+        page = st.number_input("Page", min_value=1, max_value=page_count, step=1)
+        st.caption(f"Page {page} of {page_count} ({total_rows} expenses)")
 
+        expense_df = load_expense_page(int(page), data_version())
+
+        # Use DB ID as RowID; relabel on display rather than copying the frame
         st.write("Select a row to delete:")
-        st.dataframe(expense_df, use_container_width=True)
+        st.dataframe(
+            expense_df,
+            use_container_width=True,
+            column_config={"ID": "RowID"},
+        )
 
-        row_ids = expense_df["RowID"].tolist()
+        row_ids = expense_df["ID"].tolist()
         selected_row_id = st.selectbox("RowID to delete", row_ids)
 
         if st.button("Delete Selected Expense"):
@@ -428,96 +664,20 @@ elif menu == "✂️ Delete Expense":
 elif menu == "📊 Statistics":
     st.subheader("📊 Expense Statistics")
 
-    df = load_expenses()
-    if df.empty:
+    months = fetch_month_list(data_version())
+    if not months:
         st.info("No data available yet.")
     else:
-        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-        df = df.dropna(subset=["Date"])
-        df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce").fillna(0)
-        df["Month"] = df["Date"].dt.to_period("M").astype(str)
-
-        if df.empty:
-            st.info("No valid dated records to show.")
-        else:
-            selected_month = st.selectbox(
-                "Select Month", sorted(df["Month"].unique(), reverse=True)
-            )
-            month_df = df[df["Month"] == selected_month]
-
-            if month_df.empty:
-                st.info("No records for this month.")
-            else:
-                income = month_df[month_df["Category"] == "Income"]["Amount"].sum()
-                expense = month_df[month_df["Category"] != "Income"]["Amount"].sum()
-
-                st.metric("💵 Income", f"₹ {income:,.0f}")
-                st.metric("💸 Expense", f"₹ {expense:,.0f}")
-
-                exp_only = month_df[month_df["Category"] != "Income"]
-                if not exp_only.empty:
-                    fig = px.pie(
-                        exp_only,
-                        names="Category",
-                        values="Amount",
-                        hole=0.4,
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info("No expenses in this month.")
+        render_statistics(months)
 
 # ---------------- SMART INSIGHTS & FEEDBACK ----------------
 elif menu == "🧠 Smart Insights & Feedback":
     st.subheader("🧠 Smart Insights & Feedback")
 
-    df = load_expenses()
-    if df.empty:
+    months = fetch_month_list(data_version())
+    if not months:
         st.info(
             "No data available yet. Please add some income and expenses to see insights."
         )
     else:
-        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-        df = df.dropna(subset=["Date"])
-        df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce").fillna(0)
-        df["Month"] = df["Date"].dt.to_period("M").astype(str)
-
-        if df.empty:
-            st.info("No valid dated records to show.")
-        else:
-            selected_month = st.selectbox(
-                "Select Month for Feedback",
-                sorted(df["Month"].unique(), reverse=True),
-            )
-            month_df = df[df["Month"] == selected_month]
-
-            if month_df.empty:
-                st.info("No records for this month.")
-            else:
-                income = month_df[month_df["Category"] == "Income"]["Amount"].sum()
-                expense = month_df[month_df["Category"] != "Income"]["Amount"].sum()
-                balance = income - expense
-
-                c1, c2, c3 = st.columns(3)
-                c1.metric("💵 Income", f"₹ {income:,.0f}")
-                c2.metric("💸 Expense", f"₹ {expense:,.0f}")
-                c3.metric("💰 Balance", f"₹ {balance:,.0f}")
-
-                st.markdown("---")
-
-                st.markdown("### 🧬 Lifestyle & Health Feedback")
-                health_fb = generate_health_feedback(month_df)
-                st.info(health_fb)
-
-                st.markdown("### 🪙 Income & Savings Feedback")
-                income_fb = generate_income_feedback(month_df)
-                st.success(income_fb)
-
-                exp_df = month_df[month_df["Category"] != "Income"]
-                if not exp_df.empty:
-                    st.markdown("### 📊 Where your money went")
-                    fig = px.pie(exp_df, names="Category", values="Amount", hole=0.4)
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info(
-                        "No expenses in this month, so no spending breakdown to show."
-                    )
+        render_insights(months)